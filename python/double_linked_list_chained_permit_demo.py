@@ -1,9 +1,14 @@
-import os
+import sys
+import json
+import time
 import secrets
 import random
-from typing import Optional, Dict, Any, List, Set
-from dataclasses import dataclass
+import threading
+from array import array
+from collections import deque
+from typing import Optional, Dict, Any, FrozenSet, Iterator, List, Set
 from enum import Enum
+import numpy as np
 from faker import Faker
 
 # Initialize Faker
@@ -24,89 +29,392 @@ class Domain(Enum):
     @classmethod
     def get_random_domain(cls) -> 'Domain':
         """Get a random domain from all available domains"""
-        return random.choice(list(cls))
+        return random.choice(ALL_DOMAINS)
     
     @classmethod
     def get_random_domains(cls, count: int = 1) -> Set['Domain']:
         """Get a set of random unique domains"""
-        available_domains = list(cls)
-        if count > len(available_domains):
-            count = len(available_domains)
-        return set(random.sample(available_domains, count))
+        return set(random.sample(ALL_DOMAINS, min(count, len(ALL_DOMAINS))))
     
     @classmethod
     def create_fake_departments(cls, count: int) -> List['Domain']:
         """Create random department domains using Faker"""
-        department_mapping = {
-            'finance': cls.FINANCE,
-            'accounting': cls.FINANCE,
-            'human resources': cls.HR,
-            'hr': cls.HR,
-            'information technology': cls.IT,
-            'it': cls.IT,
-            'marketing': cls.MARKETING,
-            'sales': cls.SALES,
-            'operations': cls.OPERATIONS,
-            'legal': cls.LEGAL,
-            'research': cls.RESEARCH,
-            'development': cls.DEVELOPMENT,
-            'ai': cls.AI_ML,
-            'machine learning': cls.AI_ML,
-            'data science': cls.AI_ML
-        }
-        
-        departments = []
-        for _ in range(count):
-            dept_name = fake.word().lower()
-            if dept_name in department_mapping:
-                departments.append(department_mapping[dept_name])
-            else:
-                departments.append(cls.get_random_domain())
-        
-        return departments
+        # One batched Faker draw; unmapped words fall back to a random domain
+        return [DEPARTMENT_MAPPING.get(dept_name.lower()) or cls.get_random_domain()
+                for dept_name in fake.words(nb=count)]
+
+# Materialised once so random draws don't rebuild the member list
+ALL_DOMAINS: tuple = tuple(Domain)
+
+# Department names recognised in Faker words, built once at import
+DEPARTMENT_MAPPING: Dict[str, Domain] = {
+    'finance': Domain.FINANCE,
+    'accounting': Domain.FINANCE,
+    'human resources': Domain.HR,
+    'hr': Domain.HR,
+    'information technology': Domain.IT,
+    'it': Domain.IT,
+    'marketing': Domain.MARKETING,
+    'sales': Domain.SALES,
+    'operations': Domain.OPERATIONS,
+    'legal': Domain.LEGAL,
+    'research': Domain.RESEARCH,
+    'development': Domain.DEVELOPMENT,
+    'ai': Domain.AI_ML,
+    'machine learning': Domain.AI_ML,
+    'data science': Domain.AI_ML
+}
+
+KEY_SIZE = 16  # bytes per permit key
+ENTROPY_POOL_SIZE = 4096  # bytes drawn from secrets per pool refill
+EVENT_LOG_SIZE = 4096  # pending log messages kept before the oldest are dropped
+
+# Each domain owns one bit so a permit's domains pack into a single int
+DOMAIN_BITS: Dict[Domain, int] = {domain: 1 << i for i, domain in enumerate(ALL_DOMAINS)}
+BIT_TO_DOMAIN: Dict[int, Domain] = {bit: domain for domain, bit in DOMAIN_BITS.items()}
+DOMAIN_BIT_VALUES: tuple = tuple(DOMAIN_BITS.values())
+DOMAIN_BIT_ARRAY = np.array(DOMAIN_BIT_VALUES, dtype=np.uint16)
+ALL_DOMAINS_MASK = (1 << len(ALL_DOMAINS)) - 1  # every domain bit set
+
+def domains_to_mask(domains: Set[Domain]) -> int:
+    """Pack a set of domains into a bitmask"""
+    mask = 0
+    for domain in domains:
+        mask |= DOMAIN_BITS[domain]
+    return mask
+
+def mask_to_domains(mask: int) -> List[Domain]:
+    """Unpack a bitmask into its domains, lowest bit first"""
+    domains = []
+    while mask:
+        lsb = mask & -mask
+        domains.append(BIT_TO_DOMAIN[lsb])
+        mask ^= lsb
+    return domains
+
+def random_domain_masks(count: int, min_domains: int = 1, max_domains: int = 3) -> List[int]:
+    """Draw masks of min..max distinct random domains in one vectorised pass"""
+    # Seeded from `random` so random.seed() still makes runs reproducible
+    rng = np.random.default_rng(random.getrandbits(64))
+    sizes = rng.integers(min_domains, max_domains + 1, size=count)
+    # Ranking uniform noise per row picks a uniform subset of each size
+    ranks = rng.random((count, len(ALL_DOMAINS))).argsort(axis=1).argsort(axis=1)
+    chosen = ranks < sizes[:, None]
+    return (chosen * DOMAIN_BIT_ARRAY).sum(axis=1).tolist()
+
+# Decoded domains for every possible mask. Permits with equal masks share
+# one interned entry instead of unpacking the bits again on each read.
+MASK_DOMAINS: tuple = tuple(frozenset(mask_to_domains(mask)) for mask in range(1 << len(ALL_DOMAINS)))
+MASK_DOMAIN_NAMES: tuple = tuple(
+    tuple(domain.value for domain in mask_to_domains(mask)) for mask in range(1 << len(ALL_DOMAINS))
+)
 
-@dataclass
 class Permit:
-    domains: Set[Domain]
-    key: bytes  # 16 random bytes
-    timestamp: float
-    revoked: bool = False
+    """View of one permit's fields in the column storage of its list"""
+    __slots__ = ("store", "slot")
+
+    def __init__(self, store: 'PermitLinkedList', slot: int):
+        self.store = store
+        self.slot = slot  # -1 once the permit is deleted
+
+    def _live_slot(self) -> int:
+        """Slot of this permit, rejecting views of deleted permits"""
+        slot = self.slot
+        if slot < 0:
+            raise ValueError("Permit has been deleted")
+        return slot
+
+    @property
+    def domains_mask(self) -> int:
+        return self.store.domains_mask[self._live_slot()]
+
+    @domains_mask.setter
+    def domains_mask(self, value: int) -> None:
+        # Bits outside the domain range have no entry in the MASK_* tables
+        if value & ~ALL_DOMAINS_MASK:
+            raise ValueError(f"Permit domains_mask {value} has bits outside {ALL_DOMAINS_MASK:#x}")
+        self.store.domains_mask[self._live_slot()] = value
+
+    @property
+    def key(self) -> bytes:
+        offset = self._live_slot() * KEY_SIZE
+        # Slicing copies without exporting a buffer, so a concurrent
+        # column append can't hit a BufferError
+        return bytes(self.store.keys[offset:offset + KEY_SIZE])
+
+    @key.setter
+    def key(self, value: bytes) -> None:
+        # A short or long value would shift every later key in the column
+        if len(value) != KEY_SIZE:
+            raise ValueError(f"Permit key must be {KEY_SIZE} bytes, got {len(value)}")
+        offset = self._live_slot() * KEY_SIZE
+        self.store.keys[offset:offset + KEY_SIZE] = value
+
+    @property
+    def timestamp(self) -> float:
+        return self.store.timestamps[self._live_slot()]
+
+    @timestamp.setter
+    def timestamp(self, value: float) -> None:
+        self.store.timestamps[self._live_slot()] = value
+
+    @property
+    def revoked(self) -> bool:
+        return bool(self.store.revoked[self._live_slot()])
+
+    @revoked.setter
+    def revoked(self, value: bool) -> None:
+        self.store.revoked[self._live_slot()] = value
+
+    @property
+    def domains(self) -> FrozenSet[Domain]:
+        """Domains unpacked from the bitmask, shared by permits with equal masks"""
+        return MASK_DOMAINS[self.domains_mask]
+
+    def __repr__(self) -> str:
+        return (f"Permit(domains_mask={self.domains_mask}, key={self.key!r}, "
+                f"timestamp={self.timestamp}, revoked={self.revoked})")
 
 class PermitNode:
-    def __init__(self, permit: Permit):
+    __slots__ = ("permit", "prev", "next", "id", "slot")
+
+    def __init__(self, permit: Permit, node_id: int):
         self.permit = permit
         self.prev: Optional['PermitNode'] = None
         self.next: Optional['PermitNode'] = None
-        self.id: str = secrets.token_hex(8)
+        self.id: int = node_id
+        self.slot: int = permit.slot
 
 class PermitLinkedList:
+    """Doubly linked permit list with column storage for permit fields.
+
+    Locking: a single list lock guards the links, node_map, the free
+    list, the permit columns and the entropy pool. Every mutator holds
+    it for the length of the call; under the GIL these calls are short
+    enough that per-node locks only add overhead. display_list walks the links
+    under the list lock; to_list and iter_json take it per record, so
+    the list can change between records without the walk losing its
+    place.
+    """
     def __init__(self):
+        self._lock = threading.Lock()
         self.head: Optional[PermitNode] = None
         self.tail: Optional[PermitNode] = None
         self.size = 0
-        self.node_map: Dict[str, PermitNode] = {}
+        self.node_map: Dict[int, PermitNode] = {}
+        self._next_id = 0  # integer IDs hash as themselves
+
+        # Permit fields are stored column-wise and indexed by slot.
+        # Free slots are parked as revoked with an empty mask so that
+        # column scans skip them without a separate liveness check.
+        # The columns stay growable; bulk operations view them through
+        # NumPy without copying (see _columns).
+        self.domains_mask = array('H')
+        self.keys = bytearray()  # KEY_SIZE bytes per slot
+        self.timestamps = array('d')
+        self.revoked = bytearray()
+
+        # Slots of deleted permits are reused; their nodes and Permit views
+        # are invalidated instead, so stale handles never alias a new permit
+        self.free_slots: List[int] = []
+
+        # Keys are sliced from a pooled secrets draw, guarded by the list lock
+        self._rnd_pool = b''
+        self._rnd_off = 0
+
+        # CRUD messages are queued unformatted and only when verbose
+        self.verbose = False
+        self._log: deque = deque(maxlen=EVENT_LOG_SIZE)
+
+    def _new_node(self, domains_mask: int) -> PermitNode:
+        """Store a new permit in a free or appended slot and wrap it in a node"""
+        key = self._random_bytes(KEY_SIZE)
+        timestamp = self._now()
+        node_id = self._next_id = self._next_id + 1
+        masks = self.domains_mask
+        free_slots = self.free_slots
+
+        if free_slots:
+            slot = free_slots.pop()
+            masks[slot] = domains_mask
+            self.keys[slot * KEY_SIZE:(slot + 1) * KEY_SIZE] = key
+            self.timestamps[slot] = timestamp
+            self.revoked[slot] = 0
+        else:
+            slot = len(masks)
+            masks.append(domains_mask)
+            self.keys += key
+            self.timestamps.append(timestamp)
+            self.revoked.append(0)
+
+        return PermitNode(Permit(self, slot), node_id)
+
+    def _new_nodes(self, masks: List[int], keys: bytes, timestamp: float, first_id: int) -> List[PermitNode]:
+        """Store a batch of permits, reusing free slots before growing the columns.
+
+        Caller holds the list lock and links the returned nodes.
+        """
+        free_slots = self.free_slots
+        reused = min(len(free_slots), len(masks))
+        nodes = []
+        
+        for i in range(reused):
+            slot = free_slots.pop()
+            self.domains_mask[slot] = masks[i]
+            self.keys[slot * KEY_SIZE:(slot + 1) * KEY_SIZE] = keys[i * KEY_SIZE:(i + 1) * KEY_SIZE]
+            self.timestamps[slot] = timestamp
+            self.revoked[slot] = 0
+            nodes.append(PermitNode(Permit(self, slot), first_id + i))
+        
+        fresh = len(masks) - reused
+        if fresh:
+            # Grow every column once for the rest of the batch
+            start = len(self.domains_mask)
+            self.domains_mask.extend(masks[reused:])
+            self.keys += keys[reused * KEY_SIZE:]
+            self.timestamps.extend(array('d', [timestamp]) * fresh)
+            self.revoked += bytes(fresh)
+            nodes.extend(PermitNode(Permit(self, slot), node_id)
+                         for node_id, slot in enumerate(range(start, start + fresh), first_id + reused))
+        
+        return nodes
+
+    def _columns(self):
+        """Zero-copy NumPy views of the mask and revoked columns.
+
+        Views must not outlive the call that created them, since the
+        underlying buffers cannot be resized while they are exported.
+        """
+        masks = np.frombuffer(self.domains_mask, dtype=np.uint16)
+        revoked = np.frombuffer(self.revoked, dtype=np.bool_)
+        return masks, revoked
+
+    def _selected(self, domain: Optional[Domain] = None) -> np.ndarray:
+        """Per-slot flags for non-revoked permits, optionally restricted to one domain.
+
+        Caller holds the list lock.
+        """
+        masks, revoked = self._columns()
+        selected = ~revoked
+        if domain is not None:
+            selected &= (masks & DOMAIN_BITS[domain]) != 0
+        return selected
+
+    def _active_slots(self, domain: Optional[Domain] = None) -> np.ndarray:
+        """Slots selected by _selected; caller holds the list lock"""
+        return np.flatnonzero(self._selected(domain))
+
+    def _active_nodes(self, domain: Optional[Domain] = None) -> List[PermitNode]:
+        """Snapshot of the selected nodes in list order; caller holds the list lock"""
+        result = []
+        current = self.head
+        
+        if domain is None:
+            # Check revoked directly in the walk, since a NumPy pass would
+            # prune nothing; a list copy of the column indexes faster than
+            # the bytearray itself
+            revoked = list(self.revoked)
+            while current:
+                if not revoked[current.slot]:
+                    result.append(current)
+                current = current.next
+            return result
+        
+        # Vectorised domain filter, then one walk of the links to keep list order
+        hits = self._selected(domain).tobytes()
+        while current:
+            if hits[current.slot]:
+                result.append(current)
+            current = current.next
+        
+        return result
+
+    def _column_counts(self):
+        """Revoked permit count and per-domain counts; caller holds the list lock"""
+        masks, revoked = self._columns()
+        # Free slots are parked as revoked, so discount them here
+        revoked_permits = int(np.count_nonzero(revoked)) - len(self.free_slots)
+        # One pass over the masks; masks only carry domain bits, so the
+        # per-domain counts also sum to the total domain count
+        domain_counts = np.count_nonzero(masks[:, None] & DOMAIN_BIT_ARRAY[None, :], axis=0).tolist()
+        return revoked_permits, domain_counts
+
+    def _release_node(self, node: PermitNode) -> None:
+        """Clear an unlinked node's slot for reuse and invalidate its handles"""
+        slot = node.slot
+        # Links are left in place so a walker parked on this node can
+        # follow them back into the list; slot -1 marks it dead
+        node.slot = node.permit.slot = -1
+        self.domains_mask[slot] = 0
+        self.keys[slot * KEY_SIZE:(slot + 1) * KEY_SIZE] = bytes(KEY_SIZE)
+        self.revoked[slot] = 1
+        self.free_slots.append(slot)
+
+    def _node_at(self, position: int) -> Optional[PermitNode]:
+        """Walk to the node at position from whichever end is closer"""
+        if position < self.size // 2:
+            current = self.head
+            for _ in range(position):
+                current = current.next
+        else:
+            current = self.tail
+            for _ in range(self.size - 1 - position):
+                current = current.prev
+        return current
+
+    def _log_event(self, template: str, *args: Any) -> None:
+        """Queue a log message; formatting is deferred to flush_log"""
+        if self.verbose:
+            self._log.append((template, args))
+
+    def flush_log(self) -> None:
+        """Write all queued log messages to stdout in one call"""
+        log = self._log
+        lines = []
+        # popleft rather than iterating, so concurrent appends are safe
+        while log:
+            template, args = log.popleft()
+            lines.append(template.format(*args) + "\n")
+        if lines:
+            sys.stdout.write("".join(lines))
+
+    def _now(self) -> float:
+        """Monotonic timestamp for permit changes"""
+        return time.perf_counter()
+
+    def _random_bytes(self, count: int) -> bytes:
+        """Take fresh random bytes from the pool, refilling it when exhausted.
+
+        Caller holds the list lock.
+        """
+        if self._rnd_off + count > len(self._rnd_pool):
+            self._rnd_pool = secrets.token_bytes(max(ENTROPY_POOL_SIZE, count))
+            self._rnd_off = 0
+        offset = self._rnd_off
+        self._rnd_off = offset + count
+        return self._rnd_pool[offset:offset + count]
 
     def generate_key(self) -> bytes:
         """Generate 16 random bytes for key"""
-        return secrets.token_bytes(16)
+        with self._lock:
+            return self._random_bytes(KEY_SIZE)
 
     def create_permit(self, domains: Set[Domain]) -> PermitNode:
         """Create a new permit and add to the end of the list"""
-        permit = Permit(
-            domains=domains,
-            key=self.generate_key(),
-            timestamp=os.times().elapsed
-        )
-        
-        new_node = PermitNode(permit)
+        with self._lock:
+            return self._append_permit(domains_to_mask(domains))
+
+    def _append_permit(self, domains_mask: int) -> PermitNode:
+        """Append a permit given its packed domain mask; caller holds the list lock"""
+        new_node = self._new_node(domains_mask)
+        tail = self.tail
         
-        if self.head is None:
+        if tail is None:
             self.head = new_node
-            self.tail = new_node
         else:
-            new_node.prev = self.tail
-            self.tail.next = new_node
-            self.tail = new_node
+            new_node.prev = tail
+            tail.next = new_node
+        self.tail = new_node
         
         self.size += 1
         self.node_map[new_node.id] = new_node
@@ -114,58 +422,69 @@ class PermitLinkedList:
 
     def insert_permit_at_position(self, domains: Set[Domain], position: int) -> Optional[PermitNode]:
         """Insert a new permit at a specific position in the list"""
-        if position < 0 or position > self.size:
-            print(f"Invalid position {position}. List size is {self.size}")
-            return None
-        
-        permit = Permit(
-            domains=domains,
-            key=self.generate_key(),
-            timestamp=os.times().elapsed
-        )
-        
-        new_node = PermitNode(permit)
-        
-        if position == 0:  # Insert at head
-            new_node.next = self.head
-            if self.head:
-                self.head.prev = new_node
-            self.head = new_node
-            if self.tail is None:
-                self.tail = new_node
-                
-        elif position == self.size:  # Insert at tail
-            new_node.prev = self.tail
-            if self.tail:
-                self.tail.next = new_node
-            self.tail = new_node
+        with self._lock:
+            size = self.size
+            if position < 0 or position > size:
+                self._log_event("Invalid position {}. List size is {}", position, size)
+                return None
             
-        else:  # Insert in middle
-            current = self.head
-            for _ in range(position):
-                if current:
-                    current = current.next
+            new_node = self._new_node(domains_to_mask(domains))
             
-            if current:
-                new_node.prev = current.prev
-                new_node.next = current
-                if current.prev:
-                    current.prev.next = new_node
-                current.prev = new_node
-        
-        self.size += 1
-        self.node_map[new_node.id] = new_node
-        print(f"Inserted permit at position {position} with ID {new_node.id}")
-        return new_node
+            # Find the neighbours the new node goes between; head and tail
+            # inserts are the cases where one of them is missing
+            if position == size:
+                before, after = self.tail, None
+            else:
+                after = self._node_at(position)
+                before = after.prev
+            
+            new_node.prev = before
+            new_node.next = after
+            if before:
+                before.next = new_node
+            else:
+                self.head = new_node
+            if after:
+                after.prev = new_node
+            else:
+                self.tail = new_node
+            
+            self.size = size + 1
+            self.node_map[new_node.id] = new_node
+            self._log_event("Inserted permit at position {} with ID {}", position, new_node.id)
+            return new_node
 
     def create_random_permits(self, count: int = 1) -> List[PermitNode]:
         """Create multiple permits with random domains"""
-        nodes = []
-        for _ in range(count):
-            num_domains = random.randint(1, 3)
-            random_domains = Domain.get_random_domains(num_domains)
-            node = self.create_permit(random_domains)
-            nodes.append(node)
+        if count <= 0:
+            return []
+        
+        # Draw all randomness up front: one pass for the masks, one
+        # secrets call for the keys
+        masks = random_domain_masks(count)
+        keys = secrets.token_bytes(KEY_SIZE * count)
+        
+        with self._lock:
+            now = self._now()
+            first_id = self._next_id + 1
+            self._next_id += count
+            nodes = self._new_nodes(masks, keys, now, first_id)
+            
+            # Chain the batch, then splice it onto the tail in one fixup
+            for prev_node, next_node in zip(nodes, nodes[1:]):
+                prev_node.next = next_node
+                next_node.prev = prev_node
+            
+            tail = self.tail
+            if tail is None:
+                self.head = nodes[0]
+            else:
+                tail.next = nodes[0]
+                nodes[0].prev = tail
+            self.tail = nodes[-1]
+            
+            self.size += count
+            self.node_map.update(zip(range(first_id, first_id + count), nodes))
         return nodes
 
     def create_fake_department_permits(self, count: int = 1) -> List[PermitNode]:
@@ -178,205 +497,275 @@ class PermitLinkedList:
             nodes.append(node)
         return nodes
 
-    def read_permit(self, node_id: str) -> Optional[Permit]:
+    def read_permit(self, node_id: int) -> Optional[Permit]:
         """Read a permit by node ID"""
         node = self.node_map.get(node_id)
         return node.permit if node else None
 
-    def update_permit_domains(self, node_id: str, new_domains: Set[Domain]) -> bool:
+    def update_permit_domains(self, node_id: int, new_domains: Set[Domain]) -> bool:
         """Update domains for a specific permit"""
-        node = self.node_map.get(node_id)
-        if node and not node.permit.revoked:
-            node.permit.domains = new_domains
-            node.permit.timestamp = os.times().elapsed
-            print(f"Updated domains for node {node_id}: {[d.value for d in new_domains]}")
-            return True
+        with self._lock:
+            node = self.node_map.get(node_id)
+            if node and not self.revoked[node.slot]:
+                slot = node.slot
+                self.domains_mask[slot] = domains_to_mask(new_domains)
+                self.timestamps[slot] = self._now()
+                if self.verbose:
+                    self._log_event("Updated domains for node {}: {}", node_id, [d.value for d in new_domains])
+                return True
         return False
 
-    def delete_permit(self, node_id: str) -> bool:
+    def delete_permit(self, node_id: int) -> bool:
         """Delete a permit by node ID"""
-        node = self.node_map.get(node_id)
-        if not node:
-            print(f"Node {node_id} not found for deletion")
-            return False
+        with self._lock:
+            # Lookup and removal from the node map in a single probe
+            node = self.node_map.pop(node_id, None)
+            if not node:
+                self._log_event("Node {} not found for deletion", node_id)
+                return False
+            
+            self._unlink(node)
+            return True
+
+    def _unlink(self, node: PermitNode) -> None:
+        """Splice a node already removed from node_map out of the list.
+
+        Caller holds the list lock.
+        """
+        prev_node = node.prev
+        next_node = node.next
         
-        # Remove from linked list
-        if node.prev:
-            node.prev.next = node.next
+        if prev_node:
+            prev_node.next = next_node
         else:  # This is the head
-            self.head = node.next
+            self.head = next_node
         
-        if node.next:
-            node.next.prev = node.prev
+        if next_node:
+            next_node.prev = prev_node
         else:  # This is the tail
-            self.tail = node.prev
+            self.tail = prev_node
         
-        # Remove from node map
-        del self.node_map[node_id]
         self.size -= 1
-        print(f"Deleted permit with ID {node_id}")
-        return True
+        self._log_event("Deleted permit with ID {}", node.id)
+        # Free the slot for reuse and invalidate the node's handles
+        self._release_node(node)
 
     def delete_permit_at_position(self, position: int) -> bool:
         """Delete a permit at a specific position"""
-        if position < 0 or position >= self.size:
-            print(f"Invalid position {position}. List size is {self.size}")
-            return False
-        
-        current = self.head
-        for _ in range(position):
-            if current:
-                current = current.next
-        
-        if current:
-            return self.delete_permit(current.id)
-        return False
+        with self._lock:
+            if position < 0 or position >= self.size:
+                self._log_event("Invalid position {}. List size is {}", position, self.size)
+                return False
+            
+            # The walk already holds the node, so unlink it directly
+            current = self._node_at(position)
+            del self.node_map[current.id]
+            self._unlink(current)
+            return True
 
-    def rotate_key(self, node_id: str) -> bool:
+    def rotate_key(self, node_id: int) -> bool:
         """Rotate key for a specific permit"""
-        node = self.node_map.get(node_id)
-        if node and not node.permit.revoked:
-            old_key = node.permit.key
-            node.permit.key = self.generate_key()
-            node.permit.timestamp = os.times().elapsed
-            print(f"Key rotated for node {node_id}")
-            return True
+        with self._lock:
+            node = self.node_map.get(node_id)
+            if node and not self.revoked[node.slot]:
+                # Overwrite the key in place in the contiguous key column
+                slot = node.slot
+                self.keys[slot * KEY_SIZE:(slot + 1) * KEY_SIZE] = self._random_bytes(KEY_SIZE)
+                self.timestamps[slot] = self._now()
+                self._log_event("Key rotated for node {}", node_id)
+                return True
         return False
 
-    def revoke_permit(self, node_id: str) -> bool:
+    def revoke_permit(self, node_id: int) -> bool:
         """Revoke a permit (soft delete)"""
-        node = self.node_map.get(node_id)
-        if node and not node.permit.revoked:
-            node.permit.revoked = True
-            node.permit.timestamp = os.times().elapsed
-            print(f"Revoked permit with ID {node_id}")
-            return True
+        with self._lock:
+            node = self.node_map.get(node_id)
+            if node and not self.revoked[node.slot]:
+                slot = node.slot
+                self.revoked[slot] = 1
+                self.timestamps[slot] = self._now()
+                self._log_event("Revoked permit with ID {}", node_id)
+                return True
         return False
 
-    def restore_permit(self, node_id: str) -> bool:
+    def restore_permit(self, node_id: int) -> bool:
         """Restore a revoked permit"""
-        node = self.node_map.get(node_id)
-        if node and node.permit.revoked:
-            node.permit.revoked = False
-            node.permit.timestamp = os.times().elapsed
-            print(f"Restored permit with ID {node_id}")
-            return True
+        with self._lock:
+            node = self.node_map.get(node_id)
+            if node and self.revoked[node.slot]:
+                slot = node.slot
+                self.revoked[slot] = 0
+                self.timestamps[slot] = self._now()
+                self._log_event("Restored permit with ID {}", node_id)
+                return True
         return False
 
     def bulk_rotate_keys(self, domain: Optional[Domain] = None) -> int:
         """Rotate keys for all permits (optionally filtered by domain)"""
-        rotated_count = 0
-        current = self.head
-        
-        while current:
-            if not current.permit.revoked and (domain is None or domain in current.permit.domains):
-                current.permit.key = self.generate_key()
-                current.permit.timestamp = os.times().elapsed
-                rotated_count += 1
-            current = current.next
+        # The list lock keeps the selection stable during the scatter
+        with self._lock:
+            slots = self._active_slots(domain)
+            rotated_count = len(slots)
+            
+            if rotated_count:
+                # One entropy draw for the whole batch, scattered into the key column
+                fresh = np.frombuffer(secrets.token_bytes(KEY_SIZE * rotated_count), dtype=np.uint8)
+                keys = np.frombuffer(self.keys, dtype=np.uint8).reshape(-1, KEY_SIZE)
+                keys[slots] = fresh.reshape(rotated_count, KEY_SIZE)
+                timestamps = np.frombuffer(self.timestamps, dtype=np.float64)
+                timestamps[slots] = self._now()
+                # Release the views before the lock allows the columns to grow
+                del keys, timestamps
         
         return rotated_count
 
-    def find_by_domain(self, domain: Domain) -> List[PermitNode]:
-        """Find all permits for a specific domain"""
-        result = []
+    def _iter_nodes(self, bit: int = 0) -> Iterator[PermitNode]:
+        """Lazily walk the links for non-revoked nodes carrying bit (any node when 0).
+
+        Like _iter_records, the list lock is taken per yielded node.
+        """
+        masks = self.domains_mask
+        revoked = self.revoked
         current = self.head
         
         while current:
-            if domain in current.permit.domains and not current.permit.revoked:
-                result.append(current)
-            current = current.next
-        
-        return result
+            with self._lock:
+                # Step past deleted, revoked and non-matching nodes
+                while current and (current.slot < 0 or revoked[current.slot]
+                                   or (bit and not masks[current.slot] & bit)):
+                    current = current.next
+                if current is None:
+                    break
+                node = current
+                current = current.next
+            
+            yield node
+
+    def iter_by_domain(self, domain: Domain) -> Iterator[PermitNode]:
+        """Yield active permits for a specific domain"""
+        yield from self._iter_nodes(DOMAIN_BITS[domain])
+
+    def find_by_domain(self, domain: Domain) -> List[PermitNode]:
+        """Find all permits for a specific domain"""
+        with self._lock:
+            return self._active_nodes(domain)
+
+    def count_by_domain(self, domain: Domain) -> int:
+        """Count active permits for a specific domain without building a list"""
+        with self._lock:
+            return len(self._active_slots(domain))
+
+    def iter_active_permits(self) -> Iterator[PermitNode]:
+        """Yield all non-revoked permits"""
+        yield from self._iter_nodes()
 
     def get_active_permits(self) -> List[PermitNode]:
         """Get all non-revoked permits"""
-        result = []
-        current = self.head
-        
-        while current:
-            if not current.permit.revoked:
-                result.append(current)
-            current = current.next
-        
-        return result
+        with self._lock:
+            return self._active_nodes()
 
     def display_list(self, show_revoked: bool = False) -> None:
         """Display the entire linked list"""
-        current = self.head
-        position = 0
-        
-        print(f"\n{'='*60}")
-        print(f"Permit Linked List (Size: {self.size})")
-        print(f"{'='*60}")
-        
-        if self.head is None:
-            print("List is empty")
-            return
+        # Build the whole report under the lock, then emit it with a single write
+        with self._lock:
+            parts = [f"\n{'='*60}\nPermit Linked List (Size: {self.size})\n{'='*60}"]
             
-        while current:
-            status = "REVOKED" if current.permit.revoked else "ACTIVE"
+            if self.head is None:
+                parts.append("List is empty")
             
-            if show_revoked or not current.permit.revoked:
-                print(f"Position: {position}")
-                print(f"Node ID: {current.id}")
-                print(f"Domains: {[domain.value for domain in current.permit.domains]}")
-                print(f"Key: {current.permit.key.hex()[:16]}...")  # Show first 16 chars
-                print(f"Status: {status}")
-                print(f"Timestamp: {current.permit.timestamp}")
-                print(f"{'-'*40}")
+            masks = self.domains_mask
+            keys = self.keys
+            timestamps = self.timestamps
+            revoked = self.revoked
+            current = self.head
+            position = 0
             
-            current = current.next
-            position += 1
+            while current:
+                slot = current.slot
+                
+                if show_revoked or not revoked[slot]:
+                    offset = slot * KEY_SIZE
+                    parts.append(
+                        f"Position: {position}\n"
+                        f"Node ID: {current.id}\n"
+                        f"Domains: {list(MASK_DOMAIN_NAMES[masks[slot]])}\n"
+                        f"Key: {keys[offset:offset + 8].hex()}...\n"  # Show first 16 chars
+                        f"Status: {'REVOKED' if revoked[slot] else 'ACTIVE'}\n"
+                        f"Timestamp: {timestamps[slot]}\n"
+                        f"{'-'*40}"
+                    )
+                
+                current = current.next
+                position += 1
+        
+        sys.stdout.write("\n".join(parts) + "\n")
 
-    def to_list(self) -> List[Dict[str, Any]]:
-        """Convert linked list to Python list for serialization"""
-        result = []
+    def _iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Yield one serializable dict per permit, in list order"""
+        # Each record is read under the list lock, which is released
+        # between records so consumers can stream slowly
         current = self.head
         
         while current:
-            result.append({
-                'node_id': current.id,
-                'domains': [domain.value for domain in current.permit.domains],
-                'key': current.permit.key.hex(),
-                'timestamp': current.permit.timestamp,
-                'revoked': current.permit.revoked
-            })
-            current = current.next
-        
-        return result
+            with self._lock:
+                # Step past nodes deleted since the last record
+                while current and current.slot < 0:
+                    current = current.next
+                if current is None:
+                    break
+                
+                slot = current.slot
+                offset = slot * KEY_SIZE
+                record = {
+                    'node_id': current.id,
+                    'domains': list(MASK_DOMAIN_NAMES[self.domains_mask[slot]]),
+                    'key': self.keys[offset:offset + KEY_SIZE].hex(),
+                    'timestamp': self.timestamps[slot],
+                    'revoked': bool(self.revoked[slot])
+                }
+                current = current.next
+            
+            yield record
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        """Convert linked list to Python list for serialization"""
+        return list(self._iter_records())
+
+    def iter_json(self) -> Iterator[str]:
+        """Stream the list as a JSON array without building it in memory.
+
+        Usage: sys.stdout.writelines(permit_list.iter_json())
+        """
+        yield '['
+        separator = ''
+        for record in self._iter_records():
+            yield separator + json.dumps(record)
+            separator = ','
+        yield ']'
 
     def get_statistics(self) -> Dict[str, Any]:
         """Get statistics about the permit list"""
+        with self._lock:
+            size = self.size
+            revoked_permits, domain_counts = self._column_counts()
+        
         stats = {
-            'total_permits': self.size,
-            'active_permits': 0,
-            'revoked_permits': 0,
+            'total_permits': size,
+            'active_permits': size - revoked_permits,
+            'revoked_permits': revoked_permits,
             'domain_distribution': {},
             'average_domains_per_permit': 0
         }
         
-        current = self.head
-        total_domains = 0
+        total_domains = sum(domain_counts)
         
-        while current:
-            if current.permit.revoked:
-                stats['revoked_permits'] += 1
-            else:
-                stats['active_permits'] += 1
-            
-            total_domains += len(current.permit.domains)
-            
-            for domain in current.permit.domains:
-                domain_name = domain.value
-                if domain_name not in stats['domain_distribution']:
-                    stats['domain_distribution'][domain_name] = 0
-                stats['domain_distribution'][domain_name] += 1
-            
-            current = current.next
+        distribution = stats['domain_distribution']
+        for domain, count in zip(ALL_DOMAINS, domain_counts):
+            if count:
+                distribution[domain.value] = count
         
-        if self.size > 0:
-            stats['average_domains_per_permit'] = total_domains / self.size
+        if size > 0:
+            stats['average_domains_per_permit'] = total_domains / size
         
         return stats
 
@@ -384,6 +773,7 @@ class PermitLinkedList:
 def main():
     # Create permit list
     permit_list = PermitLinkedList()
+    permit_list.verbose = True
     
     print("=== DEMONSTRATING ALL CRUD OPERATIONS ===")
     
@@ -410,14 +800,17 @@ def main():
     # Insert at beginning (position 0)
     print("Inserting at position 0 (beginning)...")
     inserted_head = permit_list.insert_permit_at_position({Domain.HR, Domain.IT}, 0)
+    permit_list.flush_log()
     
     # Insert at middle (position 2)
     print("Inserting at position 2 (middle)...")
     inserted_middle = permit_list.insert_permit_at_position({Domain.MARKETING}, 2)
+    permit_list.flush_log()
     
     # Insert at end (position = size)
     print("Inserting at the end...")
     inserted_tail = permit_list.insert_permit_at_position({Domain.LEGAL}, permit_list.size)
+    permit_list.flush_log()
     
     permit_list.display_list()
     
@@ -431,7 +824,7 @@ def main():
             print(f"Read permit {inserted_head.id}: {[d.value for d in permit_data.domains]}")
     
     # Try to read non-existent permit
-    non_existent = permit_list.read_permit("nonexistent")
+    non_existent = permit_list.read_permit(-1)
     print(f"Reading non-existent permit: {non_existent}")
     
     # 4. UPDATE OPERATIONS
@@ -450,6 +843,7 @@ def main():
     if random_nodes:
         permit_list.revoke_permit(random_nodes[0].id)
     
+    permit_list.flush_log()
     permit_list.display_list(show_revoked=True)
     
     # 5. DELETE OPERATIONS
@@ -460,18 +854,22 @@ def main():
     if inserted_middle:
         print("Deleting by node ID...")
         permit_list.delete_permit(inserted_middle.id)
+        permit_list.flush_log()
     
     # Delete by position
     print("Deleting at position 1...")
     permit_list.delete_permit_at_position(1)
+    permit_list.flush_log()
     
     # Try to delete non-existent permit
     print("Attempting to delete non-existent permit...")
-    permit_list.delete_permit("nonexistent")
+    permit_list.delete_permit(-1)
+    permit_list.flush_log()
     
     # Try to delete at invalid position
     print("Attempting to delete at invalid position...")
     permit_list.delete_permit_at_position(100)
+    permit_list.flush_log()
     
     permit_list.display_list(show_revoked=True)
     
@@ -482,6 +880,7 @@ def main():
     if random_nodes and random_nodes[0]:
         print("Restoring revoked permit...")
         permit_list.restore_permit(random_nodes[0].id)
+        permit_list.flush_log()
     
     final_stats = permit_list.get_statistics()
     print(f"\n=== FINAL STATISTICS ===")